@@ -1,3 +1,6 @@
+import time
+_startup_started = time.perf_counter()
+
 import logging
 import io
 import base64
@@ -6,6 +9,9 @@ from telegram.ext import ApplicationBuilder, ContextTypes, CommandHandler, Callb
 
 from config import FOOOCUS_BOT_TOKEN
 from logic import FooocusLogic
+from startup import StartupReport, run_startup
+
+_imports_done = time.perf_counter()
 
 # Enable logging
 logging.basicConfig(
@@ -34,7 +40,7 @@ async def models_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     # Store models in user_data is no longer strictly necessary if we fetch by index in logic, 
-    # but logic.get_model_by_index fetches fresh list anyway.
+    # logic.get_model_by_index resolves against the list this keyboard was built from.
     
     keyboard = []
     for model_name, callback_data in models_data:
@@ -241,7 +247,13 @@ if __name__ == '__main__':
         print("Error: FOOOCUS_BOT_TOKEN not found in .env or config.py")
         exit(1)
 
+    report = StartupReport(started=_startup_started)
+    report.record("imports", _imports_done - _startup_started)
+    run_startup(logic, report)
+
+    build_started = time.perf_counter()
     application = ApplicationBuilder().token(FOOOCUS_BOT_TOKEN).build()
+    report.record("telegram", time.perf_counter() - build_started)
 
     application.add_error_handler(error_handler)
     
@@ -262,5 +274,6 @@ if __name__ == '__main__':
     
     application.add_handler(MessageHandler(filters.TEXT & (~filters.COMMAND), text_handler))
 
+    logging.info(report.format())
     print("Bot is running...")
     application.run_polling(allowed_updates=Update.ALL_TYPES)
@@ -1,21 +1,38 @@
 import requests
 import json
-from config import BASE_URL
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from config import BASE_URL, FOOOCUS_POOL_SIZE
 
 class FooocusClient:
-    def __init__(self, base_url=BASE_URL):
+    def __init__(self, base_url=BASE_URL, pool_size=FOOOCUS_POOL_SIZE):
         self.base_url = base_url
+        self.pool_size = pool_size
+        # Reuse keep-alive connections instead of opening a new one per request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
-    def ping(self):
+    def ping(self, timeout=5):
         try:
-            response = requests.get(f"{self.base_url}/ping", timeout=5)
+            response = self.session.get(f"{self.base_url}/ping", timeout=timeout)
             return response.status_code == 200
         except requests.RequestException:
             return False
 
+    def open_connections(self, count=None):
+        """Open up to `count` pooled connections by pinging concurrently. Returns how many succeeded."""
+        count = self.pool_size if count is None else count
+        if count < 1:
+            return 0
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            results = list(executor.map(lambda _: self.ping(), range(count)))
+        return sum(results)
+
     def get_models(self):
         try:
-            response = requests.get(f"{self.base_url}/v1/engines/all-models", timeout=10)
+            response = self.session.get(f"{self.base_url}/v1/engines/all-models", timeout=10)
             response.raise_for_status()
             return response.json().get("model_filenames", [])
         except requests.RequestException as e:
@@ -44,8 +61,8 @@ class FooocusClient:
             payload["base_model_name"] = model_name
 
         try:
-            response = requests.post(f"{self.base_url}/v1/generation/text-to-image", 
-                                     json=payload, timeout=300) # Long timeout for generation
+            response = self.session.post(f"{self.base_url}/v1/generation/text-to-image", 
+                                         json=payload, timeout=300) # Long timeout for generation
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
@@ -54,11 +71,16 @@ class FooocusClient:
 
     def query_job(self, job_id):
         try:
-            response = requests.get(f"{self.base_url}/v1/generation/query-job", 
-                                    params={"job_id": job_id, "require_step_preview": True},
-                                    timeout=10)
+            response = self.session.get(f"{self.base_url}/v1/generation/query-job", 
+                                        params={"job_id": job_id, "require_step_preview": True},
+                                        timeout=10)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
             print(f"Error querying job: {e}")
             return None
+
+    def download(self, url):
+        response = self.session.get(url, timeout=60)
+        response.raise_for_status()
+        return response.content
@@ -9,6 +9,12 @@ FOOOCUS_PORT = os.getenv("FOOOCUS_PORT", "8888")
 
 BASE_URL = f"http://{FOOOCUS_IP}:{FOOOCUS_PORT}"
 
+# Startup: how long to wait for the API, how many connections to keep open,
+# and whether to run a tiny generation to load the default checkpoint
+FOOOCUS_STARTUP_TIMEOUT = float(os.getenv("FOOOCUS_STARTUP_TIMEOUT", "120"))
+FOOOCUS_POOL_SIZE = max(1, int(os.getenv("FOOOCUS_POOL_SIZE", "4")))
+FOOOCUS_WARMUP = os.getenv("FOOOCUS_WARMUP", "false").lower() in ("1", "true", "yes")
+
 # Safety prompts for content filtering
 SAFETY_POSITIVE_PROMPT = "underage is forbidden, adult only, fully clothed adult woman, strictly no nudity, strictly no exposed skin, no cleavage, no lingerie, no underwear, no erotic expression, no sensuality, no sexual themes, no sexual gestures, professional portrait style, modest outfit, conservative clothing, safe for work, family-safe realistic photography"
 
@@ -1,6 +1,5 @@
 import logging
 import base64
-import io
 import asyncio
 from client import FooocusClient
 from config import SAFETY_POSITIVE_PROMPT, SAFETY_NEGATIVE_PROMPT
@@ -8,6 +7,7 @@ from config import SAFETY_POSITIVE_PROMPT, SAFETY_NEGATIVE_PROMPT
 class FooocusLogic:
     def __init__(self):
         self.client = FooocusClient()
+        self.models = []
 
     def get_welcome_message(self):
         return (
@@ -18,8 +18,25 @@ class FooocusLogic:
             "Or simply send a text message to generate an image."
         )
 
-    def get_models_keyboard_data(self):
+    def refresh_models(self):
         models = self.client.get_models()
+        if models:
+            self.models = models
+        return models
+
+    def warm_up(self):
+        # Tiny synchronous job so the default checkpoint is loaded before the first user request
+        result = self.client.generate_image(
+            "warm-up",
+            performance_selection="Extreme Speed",
+            aspect_ratios_selection="1024*1024",
+            image_number=1,
+            async_process=False
+        )
+        return bool(result)
+
+    def get_models_keyboard_data(self):
+        models = self.refresh_models()
         if not models:
             return None
         
@@ -27,7 +44,8 @@ class FooocusLogic:
         return [(model, f"model:{i}") for i, model in enumerate(models)]
 
     def get_model_by_index(self, index):
-        models = self.client.get_models()
+        # Use the list the keyboard was built from; fetch only if nothing is cached yet
+        models = self.models or self.refresh_models()
         if 0 <= index < len(models):
             return models[index]
         return None
@@ -158,10 +176,7 @@ class FooocusLogic:
                             parsed_base_url = urlparse(self.client.base_url)
                             final_image_url = parsed_img_url._replace(netloc=parsed_base_url.netloc, scheme=parsed_base_url.scheme).geturl()
                             
-                            import requests
-                            img_response = requests.get(final_image_url)
-                            img_response.raise_for_status()
-                            img_bytes = img_response.content
+                            img_bytes = await loop.run_in_executor(None, lambda: self.client.download(final_image_url))
                         except Exception as e:
                             logging.error(f"Failed to retrieve image: {e}")
                             yield {"type": "error", "message": f"Failed to retrieve image from URL: {e}"}
@@ -0,0 +1,67 @@
+import logging
+import time
+from config import FOOOCUS_STARTUP_TIMEOUT, FOOOCUS_WARMUP
+
+class StartupReport:
+    def __init__(self, started=None):
+        self.started = started if started is not None else time.perf_counter()
+        self.steps = []
+
+    def record(self, name, duration, result=None):
+        self.steps.append((name, duration, result))
+
+    def step(self, name, func, *args, **kwargs):
+        """Run func, record how long it took and what it returned."""
+        step_start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            logging.error(f"Startup step '{name}' failed: {e}")
+            result = None
+        self.record(name, time.perf_counter() - step_start, result)
+        return result
+
+    def format(self):
+        lines = ["Startup report:"]
+        for name, duration, result in self.steps:
+            if isinstance(result, list):
+                result = f"{len(result)} items"
+            lines.append(f"  {name:<12} {duration:7.2f}s  {'' if result is None else result}")
+        lines.append(f"  {'total':<12} {time.perf_counter() - self.started:7.2f}s")
+        return "\n".join(lines)
+
+def wait_for_backend(client, timeout=FOOOCUS_STARTUP_TIMEOUT, interval=1.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        # Cap each ping at the time left so `timeout` is an upper bound
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        if client.ping(timeout=min(5, remaining)):
+            return True
+        time.sleep(max(0, min(interval, deadline - time.monotonic())))
+
+def run_startup(logic, report=None, timeout=FOOOCUS_STARTUP_TIMEOUT, warmup=FOOOCUS_WARMUP):
+    """
+    Prepare the Fooocus backend before the bot starts polling.
+
+    Waits for /ping, opens pooled connections, prefetches the model list and,
+    if enabled, loads the default checkpoint with a tiny job.
+    Returns the StartupReport.
+    """
+    report = report or StartupReport()
+
+    ready = report.step("ping", wait_for_backend, logic.client, timeout)
+    if not ready:
+        logging.warning(f"Fooocus API not reachable at {logic.client.base_url} after {timeout}s, starting anyway")
+        return report
+
+    report.step("connections", logic.client.open_connections)
+    models = report.step("models", logic.refresh_models)
+    if not models:
+        logging.warning("Could not prefetch models from Fooocus API")
+
+    if warmup:
+        report.step("warm-up", logic.warm_up)
+
+    return report
@@ -33,6 +33,15 @@ class TestFooocusLogic(unittest.TestCase):
         model = self.logic.get_model_by_index(5)
         self.assertIsNone(model)
 
+    def test_get_model_by_index_uses_cached_models(self):
+        self.logic.client.get_models.return_value = ["model1.safetensors", "model2.safetensors"]
+        self.logic.refresh_models()
+        self.logic.client.get_models.return_value = []
+
+        model = self.logic.get_model_by_index(0)
+        self.assertEqual(model, "model1.safetensors")
+        self.logic.client.get_models.assert_called_once()
+
     def test_get_image_count_keyboard_data(self):
         data = self.logic.get_image_count_keyboard_data()
         # Should be list of rows
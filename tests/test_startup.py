@@ -0,0 +1,71 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+# Add parent directory to path to import startup
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic import FooocusLogic
+from startup import StartupReport, run_startup, wait_for_backend
+
+class TestStartup(unittest.TestCase):
+    def setUp(self):
+        self.logic = FooocusLogic()
+        self.logic.client = MagicMock()
+        self.logic.client.ping.return_value = True
+        self.logic.client.open_connections.return_value = 4
+        self.logic.client.get_models.return_value = ["model1.safetensors"]
+
+    def test_run_startup(self):
+        report = run_startup(self.logic, timeout=1, warmup=False)
+        self.assertEqual([name for name, _, _ in report.steps], ["ping", "connections", "models"])
+        self.assertEqual(self.logic.models, ["model1.safetensors"])
+        self.assertIn("1 items", report.format())
+        self.logic.client.generate_image.assert_not_called()
+
+    def test_run_startup_with_warmup(self):
+        self.logic.client.generate_image.return_value = [{"base64": "SGVsbG8="}]
+
+        report = run_startup(self.logic, timeout=1, warmup=True)
+        self.assertEqual([name for name, _, _ in report.steps], ["ping", "connections", "models", "warm-up"])
+        args, kwargs = self.logic.client.generate_image.call_args
+        self.assertEqual(kwargs["performance_selection"], "Extreme Speed")
+        self.assertEqual(report.steps[-1][2], True)
+
+    def test_run_startup_backend_unavailable(self):
+        self.logic.client.ping.return_value = False
+
+        report = run_startup(self.logic, timeout=0, warmup=True)
+        self.assertEqual([name for name, _, _ in report.steps], ["ping"])
+        self.logic.client.get_models.assert_not_called()
+
+    def test_run_startup_step_error(self):
+        self.logic.client.open_connections.side_effect = ValueError("boom")
+
+        with patch("startup.logging.error") as mock_error:
+            report = run_startup(self.logic, timeout=1, warmup=False)
+
+        mock_error.assert_called_once()
+        self.assertIn("boom", mock_error.call_args[0][0])
+        self.assertEqual(report.steps[1][0], "connections")
+        self.assertIsNone(report.steps[1][2])
+        self.assertEqual(report.steps[-1][0], "models")
+
+    def test_wait_for_backend_caps_ping_timeout(self):
+        client = MagicMock()
+        client.ping.return_value = False
+
+        self.assertFalse(wait_for_backend(client, timeout=0.2, interval=0.05))
+        for args, kwargs in client.ping.call_args_list:
+            self.assertLessEqual(kwargs["timeout"], 0.2)
+
+    def test_report_format(self):
+        report = StartupReport()
+        report.record("imports", 0.5)
+        text = report.format()
+        self.assertIn("imports", text)
+        self.assertIn("total", text)
+
+if __name__ == '__main__':
+    unittest.main()
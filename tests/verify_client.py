@@ -12,7 +12,7 @@ class TestFooocusClient(unittest.TestCase):
     def setUp(self):
         self.client = FooocusClient(base_url="http://test-url:8888")
 
-    @patch('client.requests.get')
+    @patch('client.requests.Session.get')
     def test_ping(self, mock_get):
         mock_get.return_value.status_code = 200
         self.assertTrue(self.client.ping())
@@ -20,7 +20,7 @@ class TestFooocusClient(unittest.TestCase):
         mock_get.return_value.status_code = 500
         self.assertFalse(self.client.ping())
 
-    @patch('client.requests.get')
+    @patch('client.requests.Session.get')
     def test_get_models(self, mock_get):
         mock_response = MagicMock()
         mock_response.json.return_value = {
@@ -33,7 +33,7 @@ class TestFooocusClient(unittest.TestCase):
         self.assertEqual(models, ["model1.safetensors", "model2.safetensors"])
         mock_get.assert_called_with("http://test-url:8888/v1/engines/all-models", timeout=10)
 
-    @patch('client.requests.post')
+    @patch('client.requests.Session.post')
     def test_generate_image(self, mock_post):
         mock_response = MagicMock()
         mock_response.json.return_value = [{"base64": "fake_base64_data"}]
@@ -50,5 +50,15 @@ class TestFooocusClient(unittest.TestCase):
         self.assertEqual(kwargs['json']['base_model_name'], "test_model")
         self.assertEqual(kwargs['json']['async_process'], False)
 
+    @patch('client.requests.Session.get')
+    def test_open_connections(self, mock_get):
+        mock_get.return_value.status_code = 200
+        self.assertEqual(self.client.open_connections(3), 3)
+        self.assertEqual(mock_get.call_count, 3)
+
+        mock_get.reset_mock()
+        self.assertEqual(self.client.open_connections(0), 0)
+        mock_get.assert_not_called()
+
 if __name__ == '__main__':
     unittest.main()